@@ -1,5 +1,6 @@
 from abc import ABC
 from typing import Tuple
+from functools import cached_property
 
 from scipy.signal import welch
 from scipy.stats import linregress
@@ -77,14 +78,15 @@ class Analyzer(ABC):
             )
             for i in range(quotes.shape[1])
         ]
-        interpolated_quotes = np.concatenate(
-            [np.expand_dims(q, 0) for q in interpolated_quotes],
-            0
-        )
 
         self.n_assets = len(valid_symbols)
         self.symbols_list = valid_symbols
-        self.quotes = interpolated_quotes.T
+
+        # Write each asset into its column of a column-major (T, N) array, so that the
+        # per-asset analysis reads every asset as a contiguous block
+        self.quotes = np.empty((quotes.shape[0], len(interpolated_quotes)), order='F')
+        for i, asset_quotes in enumerate(interpolated_quotes):
+            self.quotes[:, i] = asset_quotes
         self.returns = self._compute_returns(self.quotes)
         self.cumulative_returns = (self.returns + 1).prod(axis=0)
 
@@ -187,14 +189,14 @@ class Analyzer(ABC):
 
         return sr
 
-    @property
+    @cached_property
     def sr(self) -> np.ndarray:
         """
-        Class property, the Sharpe-Ratio of the analyzed assets
+        Class property, the Sharpe-Ratio of the analyzed assets. Computed once on
+        first access, since it depends only on the quotes queried at construction.
 
-        :return: (np.ndarray) An array with shape (T - 2, # assets) containing the
-        Sharpe-Ratio of the analyzed assets. Where T is the temporal length of the
-        requested assets.
+        :return: (np.ndarray) An array with shape (# assets, ) containing the
+        Sharpe-Ratio of the analyzed assets over the requested period.
         """
 
         return self._analyze_sr()
@@ -236,12 +238,13 @@ class Analyzer(ABC):
 
         return mean_annual_returns
 
-    @property
+    @cached_property
     def mean_annual_return(self) -> np.ndarray:
         """
         Denotes the mean annual return of each asset, where the
         mean annual return is computed as the mean return over the entire
         requested period, multiplied by 255 (trading days per year on avg.)
+        Computed once on first access.
 
         :return: (np.ndarray) The mean annual return for each asset
         """
@@ -435,12 +438,13 @@ class Analyzer(ABC):
 
         return overall_returns
 
-    @property
+    @cached_property
     def overall_period_return(self) -> np.ndarray:
         """
         Class property, denoting the overall return of each asset over the most
         recent trading period, where the length of the period if determined by
         the 'trend_period_length' parameter given in the constructor.
+        Computed once on first access.
 
         :return: (np.ndarray) The overall return of each asset of the specified period
         """
@@ -512,7 +516,7 @@ class Analyzer(ABC):
         queried in the constructor.
 
         :return: (dict) a dictionary with the following key-value pairs:
-        'sr': Sharpe-Ratio per-time point, per-asset
+        'sr': Sharpe-Ratio per-asset, over the entire period
         'mean': mean annualized returns, per assets, over the entire period
         'recent_trend_mean': mean of returns, per assets over the most recent 'period'
         specified in the constructor.
@@ -1,8 +1,7 @@
 from abc import ABC
-from statsmodels.tsa.arima_model import ARIMA
-from statsmodels.tsa.statespace.sarimax import SARIMAX
 from FinancialAnalysis.analysis.smoothing import Smoother
 
+import hashlib
 import numpy as np
 
 
@@ -59,7 +58,7 @@ class Forecaster(ABC):
         ‘linear’ : Linear prediction in terms of the differenced endogenous variables.
         ‘levels’ : Predict the levels of the original endogenous variables.
         Default is 'levels'. For further details please refer to:
-        https://www.statsmodels.org -> statsmodels.tsa.arima_model.ARIMAResults.predict.
+        https://www.statsmodels.org -> statsmodels.tsa.arima.model.ARIMAResults.predict.
         :param remove_mean: (bool) Whether to normalize the data by removing
         the mean, might be useful when using the ARIMA model, which should operate on a
         stationary process.
@@ -86,8 +85,30 @@ class Forecaster(ABC):
         # Setup
         self._arima_model = None
         self._sarimax_model = None
+        self._arima_signature = None
+        self._sarimax_signature = None
         self._mean = 0
 
+        # Forecast steps h = 1, ..., forecast_horizon, used for extrapolating the
+        # trend of an exponential smoother
+        self._forecast_steps = np.arange(1, (forecast_horizon + 1), dtype=np.float64)
+
+    @staticmethod
+    def _series_signature(time_series: np.ndarray) -> tuple:
+        """
+        Utility method for producing a signature of a time-series, used for deciding
+        whether a cached fitted model can be reused for it.
+
+        :param time_series: (NumPy array) The time-series to sign
+
+        :return: (tuple) The shape, dtype and SHA1 digest of the time-series values
+        """
+
+        time_series = np.ascontiguousarray(time_series)
+        digest = hashlib.sha1(time_series.tobytes()).digest()
+
+        return time_series.shape, time_series.dtype.str, digest
+
     def _smooth_forecast_exp(self, time_series: np.ndarray) -> np.ndarray:
         """
         Utility method for producing an exponential-based predictions from the Smoother
@@ -98,11 +119,28 @@ class Forecaster(ABC):
         :return: (NumPy array) The future forecast
         """
 
+        time_series = np.asarray(time_series)
         if self._smoother.exp_smoother is None:
             self._smoother(time_series=time_series)
 
-        forecast = self._smoother.exp_smoother.predict(
-            start=len(time_series), end=(len(time_series) + self._forecast_horizon - 1))
+        # The smoothers are non-seasonal and undamped, so the forecast is given in
+        # closed-form by the final level and trend, i.e. l + h * b for an additive
+        # trend and l * b ^ h for a multiplicative one. Unlike the 'predict' method of
+        # the fitted model, this doesn't re-run the smoothing over the whole time-series
+        # The fitted components are pandas Series for a Smoother fitted on a Series
+        exp_smoother = self._smoother.exp_smoother
+        level = np.asarray(exp_smoother.level)[-1]
+        trend = exp_smoother.model.trend
+        if trend is None:
+            forecast = np.full(self._forecast_horizon, level)
+
+        elif trend == 'mul':
+            slope = np.asarray(exp_smoother.trend)[-1]
+            forecast = level * np.power(slope, self._forecast_steps)
+
+        else:
+            slope = np.asarray(exp_smoother.trend)[-1]
+            forecast = level + (self._forecast_steps * slope)
 
         return forecast
 
@@ -154,11 +192,68 @@ class Forecaster(ABC):
 
         return forecast
 
+    def _fit_arima(self, time_series: np.ndarray) -> None:
+        """
+        Utility method, fits an ARIMA model based on the parameters given at
+        construction. The fitted model is kept, and is only re-fitted when given a
+        different time-series than the one it was fitted on.
+
+        :param time_series: (NumPy array) The time-series on which to fit the model
+
+        :return: None
+        """
+
+        signature = self._series_signature(time_series)
+        if self._arima_model is None or signature != self._arima_signature:
+            from statsmodels.tsa.arima.model import ARIMA
+
+            p, d, q = self._arima_orders
+            if self._arima_prediction_type == 'linear':
+                # Predictions are in terms of the differenced time-series, hence it is
+                # differenced ahead of fitting, which also keeps the state vector small
+                time_series = np.diff(time_series, n=d)
+                d = 0
+
+            # Includes a constant in the differenced model, as the former statsmodels
+            # ARIMA did, i.e. a trend of degree 'd' in the levels. The noise variance
+            # is concentrated out of the likelihood, and stationarity isn't enforced at
+            # each iteration of the optimizer.
+            self._arima_model = ARIMA(
+                time_series,
+                order=(p, d, q),
+                trend=([0] * d + [1]),
+                enforce_stationarity=False,
+                concentrate_scale=True,
+            ).fit()
+            self._arima_signature = signature
+
+    def _fit_sarimax(self, time_series: np.ndarray) -> None:
+        """
+        Utility method, fits an SARIMAX model based on the parameters given at
+        construction. The fitted model is kept, and is only re-fitted when given a
+        different time-series than the one it was fitted on.
+
+        :param time_series: (NumPy array) The time-series on which to fit the model
+
+        :return: None
+        """
+
+        signature = self._series_signature(time_series)
+        if self._sarimax_model is None or signature != self._sarimax_signature:
+            from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+            self._sarimax_model = SARIMAX(
+                time_series,
+                order=self._sarimax_orders,
+                seasonal_order=self._sarimax_seasonal_order,
+            ).fit()
+            self._sarimax_signature = signature
+
     def _arima_forecast(self, time_series: np.ndarray, prediction_start: int,
                         prediction_end: int) -> np.ndarray:
         """
-        Utility method, fits & uses an ARIMA model based on the parameters given
-        at construction for producing future returns.
+        Utility method, uses an ARIMA model based on the parameters given
+        at construction for producing future returns, fits it if required.
 
         :param time_series: (NumPy array) The time-series on which to compute forecasts
         :param prediction_start: (int) Index from which to start predictions,
@@ -169,23 +264,26 @@ class Forecaster(ABC):
         :return: (NumPy array) The future forecast
         """
 
-        if self._arima_model is None:
-            self._arima_model = ARIMA(time_series, order=self._arima_orders).fit()
+        self._fit_arima(time_series=time_series)
 
         if prediction_start is None or prediction_end is None:
             prediction_start = len(time_series)
             prediction_end = len(time_series) + self._forecast_horizon - 1
 
-        forecast = self._arima_model.predict(start=prediction_start, end=prediction_end,
-                                             typ=self._arima_prediction_type)
+        if self._arima_prediction_type == 'linear':
+            # The differenced time-series starts 'd' time-points after the original one
+            prediction_start -= self._arima_orders[1]
+            prediction_end -= self._arima_orders[1]
+
+        forecast = self._arima_model.predict(start=prediction_start, end=prediction_end)
 
         return forecast
 
     def _sarimax_forecast(self, time_series: np.ndarray, prediction_start: int,
                           prediction_end: int) -> np.ndarray:
         """
-        Utility method, fits & uses an SARIMAX model based on the parameters given
-        at construction for producing future returns.
+        Utility method, uses an SARIMAX model based on the parameters given
+        at construction for producing future returns, fits it if required.
 
         :param time_series: (NumPy array) The time-series on which to compute forecasts
         :param prediction_start: (int) Index from which to start predictions,
@@ -196,12 +294,7 @@ class Forecaster(ABC):
         :return: (NumPy array) The future forecast
         """
 
-        if self._sarimax_model is None:
-            self._sarimax_model = SARIMAX(
-                time_series,
-                order=self._sarimax_orders,
-                seasonal_order=self._sarimax_seasonal_order,
-            ).fit()
+        self._fit_sarimax(time_series=time_series)
 
         if prediction_start is None or prediction_end is None:
             prediction_start = len(time_series)
@@ -214,6 +307,31 @@ class Forecaster(ABC):
 
         return forecast
 
+    def fit(self, time_series: np.ndarray) -> None:
+        """
+        Fits the model used by the forecasting method on a time-series, without
+        producing any forecasts. Later calls to 'forecast' with the same time-series
+        only perform predictions from the fitted model, which is useful when
+        predicting several ranges from a single fit.
+
+        :param time_series: (NumPy array) The time-series on which to fit the model
+
+        :return: None
+        """
+
+        if self._remove_mean:
+            self._mean = np.mean(time_series, axis=-1)
+            time_series = time_series - self._mean
+
+        if self._method == 'smoother':
+            self._smoother(time_series=time_series)
+
+        elif self._method == 'arima':
+            self._fit_arima(time_series=time_series)
+
+        elif self._method == 'sarimax':
+            self._fit_sarimax(time_series=time_series)
+
     def forecast(self, time_series: np.ndarray, prediction_start: int = None,
                  prediction_end: int = None) -> np.ndarray:
         """
@@ -234,7 +352,7 @@ class Forecaster(ABC):
 
         if self._remove_mean:
             self._mean = np.mean(time_series, axis=-1)
-            time_series -= self._mean
+            time_series = time_series - self._mean
 
         if self._method == 'smoother':
             forecast = self._smooth_forecast(time_series=time_series) + self._mean
@@ -317,3 +435,5 @@ class Forecaster(ABC):
 
         self._arima_model = None
         self._sarimax_model = None
+        self._arima_signature = None
+        self._sarimax_signature = None
@@ -4,6 +4,8 @@ from FinancialAnalysis.analysis.smoothing import Smoother
 from FinancialAnalysis.analysis.analyzing import Analyzer
 from FinancialAnalysis.stocks_io.data_queries import get_multiple_assets
 
+import numpy as np
+
 
 class Scanner(ABC):
     """
@@ -310,64 +312,48 @@ class Scanner(ABC):
 
         self.quote_criterions.update(criterions)
 
-    def _test_quote_criterion(self, asset_quote_stats: dict) -> bool:
+    def _test_quote_criterions(self, quotes_analysis: dict) -> np.ndarray:
         """
-        A utility method for testing whether a specific asset upholds the quote
-        requirements specified in self.quote_criterions.
+        A utility method for testing which of the assets uphold the quote
+        requirements specified in self.quote_criterions, all assets are tested at once.
 
-        :param asset_quote_stats:  (dict) A dictionary containing the results of all
-        quotes based analysis for the asset in question.
+        :param quotes_analysis: (dict) A dictionary containing the results of all
+        quotes based analysis, where the results of each analysis hold all assets.
 
-        :return: (bool) True/False, indicating whether the asset upholds all
-        required criterions. Returns True if yes, False if not.
+        :return: (np.ndarray) A boolean array with shape (# assets, ), True for
+        each asset which upholds all required criterions, and False otherwise.
         """
 
-        for criterion in self.quote_criterions:
-            if criterion == 'linear_regression_fit':
-                assert len(self.quote_criterions[criterion]) == 3
-
-                slope = asset_quote_stats[criterion][0]
-                intercept = asset_quote_stats[criterion][1]
-                r_sq = asset_quote_stats[criterion][2]
-
-                slope_criterion = self.quote_criterions[criterion][0]
-                intercept_criterion = self.quote_criterions[criterion][1]
-                r_sq_criterion = self.quote_criterions[criterion][2]
+        mask = np.ones(len(self.symbols_list), dtype=bool)
+        for criterion, bounds in self.quote_criterions.items():
+            stats = np.asarray(quotes_analysis[criterion])
 
-                cond = True
-                if slope_criterion is not None and slope < slope_criterion:
-                    cond = False
-
-                if intercept_criterion is not None and intercept < intercept_criterion:
-                    cond = False
-
-                if r_sq_criterion is not None and r_sq < r_sq_criterion:
-                    cond = False
+            if criterion == 'linear_regression_fit':
+                assert len(bounds) == 3
 
-                return cond
+                # Minimal slope, intercept and R^2 values, where None means no bound
+                for j, lower_bound in enumerate(bounds):
+                    if lower_bound is not None:
+                        mask &= stats[:, j] >= lower_bound
 
             elif criterion == 'top_k' or criterion == 'bottom_k':
-                if asset_quote_stats[criterion] < self.quote_criterions[criterion]:
-                    return True
+                mask &= stats < bounds
 
-                else:
-                    return False
-
-            elif (asset_quote_stats[criterion] < self.quote_criterions[criterion][0] or
-                  asset_quote_stats[criterion] > self.quote_criterions[criterion][
-                      1]):
-                return False
+            else:
+                mask &= (stats >= bounds[0]) & (stats <= bounds[1])
 
-        return True
+        return mask
 
-    def scan_for_potential_assets(self, ignore_none: bool = True) -> List[Tuple[int, str]]:
+    def scan_for_potential_assets(
+            self, ignore_none: bool = True) -> List[Tuple[int, str]]:
         """
         The main method to be used by a user in the Scanner class. After all macro &
         quotes criterions have been specified, scan all assets given in construction
         over the specified temporal period, and detect all asset that fit the
         required criterions.
 
-        :param ignore_none: (bool) Whether to ignore Missing macro values or not. Default is True.
+        :param ignore_none: (bool) Whether to ignore Missing macro values or not.
+        Default is True.
 
         :return: (list) A list of string, containing the trade symbols of all suitable
         assets.
@@ -379,27 +365,22 @@ class Scanner(ABC):
         else:
             quotes_analysis = None
 
+        quote_criterions = (
+            self._test_quote_criterions(quotes_analysis=quotes_analysis)
+            if quotes_analysis is not None
+            else np.ones(len(self.symbols_list), dtype=bool)
+        )
+
         symbols = []
         for i, symbol in enumerate(self.symbols_list):
-            macro = self.macros[i]
-            quotes_criterions = (
-                {
-                    key: quotes_analysis[key][i]
-                    for key in quotes_analysis
-                }
-                if quotes_analysis is not None
-                else None
-            )
+            if not quote_criterions[i]:
+                continue
 
             macro_criterion = self._test_macro_criterion(
-                asset_macro=macro, current_price=self.quotes[-1, i], ignore_none=ignore_none)
-
-            quote_criterion = (
-                self._test_quote_criterion(asset_quote_stats=quotes_criterions)
-                if quotes_criterions is not None else True
-            )
+                asset_macro=self.macros[i], current_price=self.quotes[-1, i],
+                ignore_none=ignore_none)
 
-            if quote_criterion and macro_criterion:
+            if macro_criterion:
                 symbols.append((i, symbol))
 
         return symbols
@@ -1,10 +1,38 @@
 from abc import ABC
-from scipy.signal import convolve
-from numpy.polynomial.polynomial import Polynomial
-from statsmodels.tsa.api import ExponentialSmoothing, SimpleExpSmoothing
+from functools import lru_cache
+from scipy.signal import convolve, lfilter
+from scipy.optimize import minimize_scalar
+from numpy.polynomial.polynomial import Polynomial, polyvander
 
 import numpy as np
 
+# Window length from which a running-window average is computed by cumulative sums
+# rather than by a direct convolution
+MAX_CONVOLUTION_WINDOW = 16
+
+
+@lru_cache(maxsize=32)
+def _polyfit_design(length: int, degree: int) -> (np.ndarray, np.ndarray):
+    """
+    Utility method for computing the design of a least-squares polynomial fit over
+    the time axis [0, length - 1], scaled onto [-1, 1] for a well-conditioned fit.
+    Since it depends only on the series length and the polynomial degree, it is
+    computed once and shared between all fits with the same length and degree.
+
+    :param length: (int) Length of the time-series to fit
+    :param degree: (int) The degree of the fitted polynomial
+
+    :return: (Tuple) The (length, degree + 1) Vandermonde matrix and its
+    (degree + 1, length) pseudo-inverse, both read-only
+    """
+
+    vander = polyvander(np.linspace(-1, 1, length), degree)
+    vander_pinv = np.linalg.pinv(vander)
+    vander.flags.writeable = False
+    vander_pinv.flags.writeable = False
+
+    return vander, vander_pinv
+
 
 class Smoother(ABC):
     """
@@ -58,22 +86,75 @@ class Smoother(ABC):
         """
         Utility method which takes in a NumPy array representing a time-series,
         and output the a smoothed time series, by using a running-window averaging with
-        a window length 'length'. Note that this method returns only the 'same'
-        segment of the convolution, hence the outputted signal size will be identical
-        to the inputted one.
+        a window length 'length'. Each point is averaged with the 'length' - 1 points
+        preceding it, where the first observation is repeated before the beginning of
+        the time-series, hence the outputted signal size will be identical to the
+        inputted one.
 
-        :param time_series: (NumPy array) The time-series to smooth
+        :param time_series: (NumPy array) The time-series to smooth, either a single
+        time-series of shape (T, ) or N time-series of length T, given as the columns
+        of an array of shape (T, N).
 
         :return: (NumPy array) The smoothed time-series
         """
 
-        # Define the averaging window
-        window = (1 / self.length) * np.ones((self.length,))
-        smoothed_time_series = convolve(time_series, window, mode='valid',
-                                        method='auto')
+        # Pad the beginning of the time-series with its first observation, so that the
+        # running window is defined over the entire time-series
+        time_series = np.asarray(time_series)
+        pad_width = ((self.length - 1, 0),) + (((0, 0),) * (time_series.ndim - 1))
+        time_series = np.pad(time_series, pad_width, mode='edge')
+
+        # Short windows over a single time-series are cheapest as a direct
+        # convolution, otherwise average over the running window as a difference of
+        # cumulative sums along the temporal axis, which costs O(T) regardless of
+        # the window length
+        if time_series.ndim == 1 and self.length < MAX_CONVOLUTION_WINDOW:
+            window = (1 / self.length) * np.ones((self.length,))
+            smoothed_time_series = convolve(time_series, window, mode='valid',
+                                            method='auto')
+
+        else:
+            # Missing observations are summed as zeros and the windows containing them
+            # are set to NaN afterwards, so that as with the convolution, a NaN only
+            # affects the windows containing it rather than all that follow it
+            nans = np.isnan(time_series)
+            cumsum = np.zeros(((time_series.shape[0] + 1,) + time_series.shape[1:]))
+            np.cumsum(np.where(nans, 0, time_series), axis=0, out=cumsum[1:])
+            smoothed_time_series = cumsum[self.length:] - cumsum[:-self.length]
+            smoothed_time_series /= self.length
+
+            if nans.any():
+                nans_count = np.zeros(cumsum.shape, dtype=np.int64)
+                np.cumsum(nans, axis=0, out=nans_count[1:])
+                windows_nans = nans_count[self.length:] - nans_count[:-self.length]
+                smoothed_time_series[windows_nans > 0] = np.nan
 
         return smoothed_time_series
 
+    @staticmethod
+    def _ses_sse(alpha: float, time_series: np.ndarray,
+                 initial_level: float) -> float:
+        """
+        Utility method for computing the sum of squared one-step-ahead errors of a
+        simple exponential smoothing with a given smoothing factor, used as the
+        objective when optimizing alpha. The smoothing recursion
+        level[t] = alpha * y[t] + (1 - alpha) * level[t - 1] is a first order IIR
+        filter, and is computed as such.
+
+        :param alpha: (float) The smoothing factor
+        :param time_series: (NumPy array) The time-series to smooth
+        :param initial_level: (float) The level preceding the first observation
+
+        :return: (float) The sum of squared errors
+        """
+
+        levels, _ = lfilter([alpha], [1, (alpha - 1)], time_series,
+                            zi=[(1 - alpha) * initial_level])
+        residuals = time_series[1:] - levels[:-1]
+        sse = np.dot(residuals, residuals) + (time_series[0] - initial_level) ** 2
+
+        return sse
+
     def _exponential_smoothing(self, time_series: np.ndarray) -> np.ndarray:
         """
         Utility method which takes in a NumPy array representing a time-series,
@@ -84,13 +165,27 @@ class Smoother(ABC):
         :return: (NumPy array) The smoothed time-series
         """
 
-        if self.optimize:
-            exp_smooth = SimpleExpSmoothing(time_series).fit(optimized=True)
-            self.alpha = exp_smooth.params['smoothing_level']
+        # statsmodels' time-series models are slow to import, hence they are imported
+        # on demand by the methods using them, here and in the Forecaster
+        from statsmodels.tsa.holtwinters import SimpleExpSmoothing
 
-        else:
-            exp_smooth = SimpleExpSmoothing(time_series).fit(smoothing_level=self.alpha,
-                                                             optimized=False)
+        # The initial level is taken as the first observation, so that alpha is the
+        # only parameter to fit
+        time_series = np.asarray(time_series)
+        initial_level = time_series[0]
+        if self.optimize:
+            self.alpha = minimize_scalar(
+                self._ses_sse,
+                bounds=(1e-4, 1 - 1e-4),
+                args=(time_series, initial_level),
+                method='bounded',
+            ).x
+
+        exp_smooth = SimpleExpSmoothing(
+            time_series,
+            initialization_method='known',
+            initial_level=initial_level,
+        ).fit(smoothing_level=self.alpha, optimized=False)
 
         self.exp_smoother = exp_smooth
         smoothed_time_series = exp_smooth.fittedvalues
@@ -107,8 +202,15 @@ class Smoother(ABC):
         :return: (NumPy array) The smoothed time-series
         """
 
+        from statsmodels.tsa.holtwinters import ExponentialSmoothing
+
+        # The smoothing recursions are already compiled within statsmodels, most of the
+        # fitting time goes to the brute-force grid search for the starting values.
+        # The optimizer converges without it for an additive or no trend, but not for
+        # a multiplicative one.
+        use_brute = self.trend in ('mul', 'multiplicative')
         exp_smooth = ExponentialSmoothing(time_series, damped_trend=False,
-                                          trend=self.trend).fit()
+                                          trend=self.trend).fit(use_brute=use_brute)
         self.exp_smoother = exp_smooth
         smoothed_time_series = exp_smooth.fittedvalues
 
@@ -125,10 +227,20 @@ class Smoother(ABC):
         :return: (NumPy array) The smoothed time-series
         """
 
-        x = np.arange(len(time_series))
-        poly = Polynomial.fit(x, time_series, deg=self.poly_degree)
-        self.poly = poly
-        fitted_time_series = poly(x)
+        # The fit is performed in float64 also for lower precision inputs, since the
+        # Vandermonde matrix becomes ill-conditioned as the degree grows
+        time_series = np.asarray(time_series, dtype=np.float64)
+
+        # The least-squares fit reduces to a single product with the cached
+        # pseudo-inverse of the Vandermonde matrix over the time axis
+        n = len(time_series)
+        vander, vander_pinv = _polyfit_design(n, self.poly_degree)
+        coefficients = vander_pinv @ time_series
+
+        # Polynomial maps the time axis [0, n - 1] onto the [-1, 1] window the
+        # coefficients were fitted over, also when evaluated beyond it
+        self.poly = Polynomial(coefficients, domain=[0, n - 1], window=[-1, 1])
+        fitted_time_series = vander @ coefficients
 
         return fitted_time_series
 
@@ -169,6 +281,18 @@ class Smoother(ABC):
 
         return self.smooth(time_series=time_series)
 
+    @property
+    def batched(self) -> bool:
+        """
+        Smoother instance Property. Whether the current smoothing method can smooth
+        several time-series of the same length at once, given as the columns of an
+        array of shape (T, N).
+
+        :return: (bool) True if the method supports batches of time-series
+        """
+
+        return self.method == 'avg'
+
     @property
     def description(self) -> str:
         """
@@ -2,18 +2,14 @@ from FinancialAnalysis.analysis.analyzing import Analyzer
 from FinancialAnalysis import PROJECT_ROOT
 from FinancialAnalysis.analysis.scanning import Scanner
 from FinancialAnalysis.visualizations.plot_assets import plot_assets_list
-from FinancialAnalysis.stocks_io.data_queries import (
-    get_sp500_symbols_wiki,
-    get_nasdaq100_symbols_wiki,
-)
+from FinancialAnalysis.stocks_io.data_queries import get_indices_symbols_wiki
 
 import os
 
 # Define data parameters
-sp500_symbols, sp500_names = get_sp500_symbols_wiki()
-nasdaq100_symbols, nasdaq100_names = get_nasdaq100_symbols_wiki()
+symbols, names = get_indices_symbols_wiki(indices=('sp500', 'nasdaq100'))
 
-symbols_list = tuple(sp500_symbols + nasdaq100_symbols)
+symbols_list = tuple(symbols)
 start_date = "2017-06-03"
 end_date = "2022-06-03"
 quote_channel = 'Close'
@@ -1,17 +1,138 @@
-from typing import Dict
+from typing import Dict, Tuple
+from functools import lru_cache
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from FinancialAnalysis.utils.hashing import dict_hash
 
 import os
 import pickle
 import requests
-import bs4 as bs
 import numpy as np
 import yfinance as yf
 
+from lxml import etree, html
+
+
+# Location of the constituents table of each supported index on Wikipedia. 'table_id'
+# is the id of the table in the page, and 'symbol_column' / 'name_column' are the
+# columns holding the symbols and the companies names.
+WIKI_INDICES = {
+    'sp500': {
+        'url': r'http://en.wikipedia.org/wiki/List_of_S%26P_500_companies',
+        'table_id': 'constituents',
+        'symbol_column': 0,
+        'name_column': 1,
+    },
+    'nasdaq100': {
+        'url': r'https://en.wikipedia.org/wiki/Nasdaq-100',
+        'table_id': 'constituents',
+        'symbol_column': 1,
+        'name_column': 0,
+    },
+}
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux i686)'
+                  ' AppleWebKit/537.17 (KHTML, like Gecko)'
+                  ' Chrome/24.0.1312.27 Safari/537.17'
+}
+
+# HTTP session shared by all queries of the listing websites, so that repeated queries
+# to the same host reuse its connection instead of opening a new one per request
+HTTP_SESSION = requests.Session()
+
+# Compiled XPath queries used for parsing the Wikipedia tables: the table with a given
+# id in a page, and the data rows (i.e. without the header) of a table
+_XP_WIKI_TABLE = etree.XPath('//table[@id=$table_id]')
+_XP_TABLE_ROWS = etree.XPath('.//tr[td]')
+
+
+def _parse_wiki_table(content: bytes, table_id: str, symbol_column: int,
+                      name_column: int) -> (tuple, tuple):
+    """
+    Utility method, which parses the symbols and names of the companies listed in
+    a table of a Wikipedia page.
+
+    :param content: (bytes) The HTML content of the page.
+    :param table_id: (str) The id of the table to parse.
+    :param symbol_column: (int) The column of the table containing the symbols.
+    :param name_column: (int) The column of the table containing the companies names.
+
+    :return: (tuple, tuple) A tuple of the symbols listed in the table, and a tuple of
+    the companies names ordered similarly to the symbols.
+    """
+
+    tables = _XP_WIKI_TABLE(html.fromstring(content), table_id=table_id)
+    assert len(tables) == 1, \
+        f"Expected a single table with the id '{table_id}' in the page, " \
+        f"found {len(tables)}."
+
+    cells = [row.findall('td') for row in _XP_TABLE_ROWS(tables[0])]
+    symbols = tuple(row[symbol_column].text_content().strip() for row in cells)
+    names = tuple(row[name_column].text_content().strip() for row in cells)
+
+    return symbols, names
+
+
+@lru_cache(maxsize=16)
+def _parse_symbols_wiki(url: str, table_id: str, symbol_column: int, name_column: int,
+                        headers: Tuple[Tuple[str, str], ...]) -> (tuple, tuple):
+    """
+    Utility method, which queries a Wikipedia page and parses the symbols and names
+    of the companies listed in one of its tables. Results are cached for the lifetime
+    of the process, hence all arguments must be hashable.
+
+    :param url: (str) Wiki url to query the symbols from.
+    :param table_id: (str) The id of the table to parse.
+    :param symbol_column: (int) The column of the table containing the symbols.
+    :param name_column: (int) The column of the table containing the companies names.
+    :param headers: (Tuple) The (key, value) items of the headers for querying
+    the website.
+
+    :return: (tuple, tuple) A tuple of the symbols listed in the table, and a tuple of
+    the companies names ordered similarly to the symbols.
+    """
+
+    resp = HTTP_SESSION.get(url, headers=dict(headers))
+
+    return _parse_wiki_table(content=resp.content, table_id=table_id,
+                             symbol_column=symbol_column, name_column=name_column)
+
+
+def _get_symbols_wiki(url: str, table_id: str, symbol_column: int, name_column: int,
+                      headers: Dict[str, str] = None) -> (list, list):
+    """
+    Utility method, which returns the symbols and names of the companies listed in
+    one of the tables of a Wikipedia page. Each page is only queried and parsed
+    once per process, later calls return new lists holding the cached results.
+
+    :param url: (str) Wiki url to query the symbols from.
+    :param table_id: (str) The id of the table to parse.
+    :param symbol_column: (int) The column of the table containing the symbols.
+    :param name_column: (int) The column of the table containing the companies names.
+    :param headers: (dict) Defines the User-Agent for querying the website.
+    Defaults to None, in which it then takes the value of DEFAULT_HEADERS.
+
+    :return: (list, list) A list of the symbols listed in the table, and a list of
+    the companies names ordered similarly to the list of symbols.
+    """
+
+    if headers is None:
+        headers = DEFAULT_HEADERS
+
+    symbols, names = _parse_symbols_wiki(
+        url=url,
+        table_id=table_id,
+        symbol_column=symbol_column,
+        name_column=name_column,
+        headers=tuple(sorted(headers.items())),
+    )
+
+    return list(symbols), list(names)
+
 
 def get_sp500_symbols_wiki(
-        url: str = r'http://en.wikipedia.org/wiki/List_of_S%26P_500_companies',
+        url: str = WIKI_INDICES['sp500']['url'],
         headers: Dict[str, str] = None) -> (list, list):
     """
     A method for getting the symbols of assets currently included as part
@@ -30,26 +151,20 @@ def get_sp500_symbols_wiki(
     to the list of symbols.
     """
 
-    if headers is None:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux i686)'
-                          ' AppleWebKit/537.17 (KHTML, like Gecko)'
-                          ' Chrome/24.0.1312.27 Safari/537.17'
-        }
-
-    # Query the list of companies included in the S&P 500 index from Wikipedia
-    resp = requests.get(url, headers=headers)
-    soup = bs.BeautifulSoup(resp.text, 'lxml')
-    table = soup.find('table', {'class': 'wikitable sortable'})
-    tables_rows = table.findAll('tr')[1:]
-    symbols = [row.findAll('td')[0].text.strip() for row in tables_rows]
-    names = [row.findAll('td')[1].text.strip() for row in tables_rows]
+    index = WIKI_INDICES['sp500']
+    symbols, names = _get_symbols_wiki(
+        url=url,
+        table_id=index['table_id'],
+        symbol_column=index['symbol_column'],
+        name_column=index['name_column'],
+        headers=headers,
+    )
 
     return symbols, names
 
 
 def get_nasdaq100_symbols_wiki(
-        url: str = r'https://en.wikipedia.org/wiki/Nasdaq-100',
+        url: str = WIKI_INDICES['nasdaq100']['url'],
         headers: Dict[str, str] = None) -> (list, list):
     """
     A method for getting the symbols of assets currently included as part
@@ -68,21 +183,87 @@ def get_nasdaq100_symbols_wiki(
     to the list of symbols.
     """
 
-    if headers is None:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux i686)'
-                          ' AppleWebKit/537.17 (KHTML, like Gecko)'
-                          ' Chrome/24.0.1312.27 Safari/537.17'
-        }
+    index = WIKI_INDICES['nasdaq100']
+    symbols, names = _get_symbols_wiki(
+        url=url,
+        table_id=index['table_id'],
+        symbol_column=index['symbol_column'],
+        name_column=index['name_column'],
+        headers=headers,
+    )
+
+    return symbols, names
+
+
+def get_indices_symbols_wiki(
+        indices: (str, ...) = ('sp500', 'nasdaq100'),
+        headers: Dict[str, str] = None) -> (list, list):
+    """
+    A method for getting the symbols of assets currently included in any of several
+    indices. The Wikipedia pages of all indices are queried concurrently.
+
+    :param indices: (Tuple) Tuple of strings, where each element denotes an index to
+    query, must be keys of WIKI_INDICES. Defaults to ('sp500', 'nasdaq100').
+    :param headers: (dict) Defines the User-Agent for querying the website.
+    Defaults to None, in which it then takes the value of DEFAULT_HEADERS.
+
+    :return: (list, list) A list of the symbols of stocks currently included
+    in any of the requested indices, without repetitions and ordered by the order of
+    'indices', and a list of the companies names ordered similarly to the list of
+    symbols.
+    """
+
+    for index in indices:
+        assert index in WIKI_INDICES, \
+            f"The {index} index is not currently supported. Please " \
+            f"use any of the following: {tuple(WIKI_INDICES.keys())}."
+
+    with ThreadPoolExecutor(max_workers=max(1, len(indices))) as executor:
+        results = list(
+            executor.map(
+                lambda index: _get_symbols_wiki(headers=headers, **WIKI_INDICES[index]),
+                indices,
+            )
+        )
+
+    # Keep the first appearance of each symbol
+    symbols_names = {}
+    for symbols, names in results:
+        for symbol, name in zip(symbols, names):
+            symbols_names.setdefault(symbol, name)
 
-    # Query the list of companies included in the S&P 500 index from Wikipedia
-    resp = requests.get(url, headers=headers)
-    soup = bs.BeautifulSoup(resp.text, 'lxml')
-    table = soup.findAll('table', {'class': 'wikitable sortable'})
-    table = table[2]
-    tables_rows = table.findAll('tr')[1:]
-    symbols = [row.findAll('td')[1].text.strip() for row in tables_rows]
-    names = [row.findAll('td')[0].text.strip() for row in tables_rows]
+    symbols = list(symbols_names.keys())
+    names = list(symbols_names.values())
+
+    return symbols, names
+
+
+@lru_cache(maxsize=4)
+def _parse_nasdaq_listed_symbols(url: str,
+                                 headers: Tuple[Tuple[str, str], ...]) -> (tuple, tuple):
+    """
+    Utility method, which queries the NASDAQ listing file and parses the symbols and
+    names of all of the assets traded at the NASDAQ stock exchange. Results are
+    cached for the lifetime of the process, hence all arguments must be hashable.
+
+    :param url: (str) NASDAQ url to query the symbols from.
+    :param headers: (Tuple) The (key, value) items of the headers for querying
+    the website.
+
+    :return: (tuple, tuple) A tuple of the symbols of all stocks currently
+    traded in the NASDAQ, and a tuple of the companies names ordered similarly
+    to the symbols.
+    """
+
+    # Query data from NASDAQ Website
+    response = HTTP_SESSION.get(url, headers=dict(headers))
+    txt_contents = response.text
+
+    # Parse the symbols from the text
+    lines = txt_contents.split(os.linesep)[1:-2]
+    symbols = tuple(line.split('|')[0] for line in lines)
+    names = tuple(line.split('|')[1].split('-')[0].strip(os.sep).strip(' ')
+                  for line in lines)
 
     return symbols, names
 
@@ -108,23 +289,14 @@ def get_nasdaq_listed_symbols(
     """
 
     if headers is None:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux i686)'
-                          ' AppleWebKit/537.17 (KHTML, like Gecko)'
-                          ' Chrome/24.0.1312.27 Safari/537.17'
-        }
-
-    # Query data from NASDAQ Website
-    response = requests.get(url, headers)
-    txt_contents = response.text
+        headers = DEFAULT_HEADERS
 
-    # Parse the symbols from the text
-    lines = txt_contents.split(os.linesep)[1:-2]
-    symbols = [line.split('|')[0] for line in lines]
-    names = [line.split('|')[1].split('-')[0].strip(os.sep).strip(' ')
-             for line in lines]
+    symbols, names = _parse_nasdaq_listed_symbols(
+        url=url,
+        headers=tuple(sorted(headers.items())),
+    )
 
-    return symbols, names
+    return list(symbols), list(names)
 
 
 def _load_asset_data(symbol: str, start_date: str, end_date: str = None,
@@ -276,20 +448,39 @@ def _load_asset_data(symbol: str, start_date: str, end_date: str = None,
                             rounding=False)
 
     # Get the temporal axis
-    dates = [str(t).split('T')[0] for t in quotes[quote_channels[0]].index.values]
+    dates = quotes.index.strftime(datetime_format).tolist()
 
-    # Get the financial quotes
-    quotes = {channel: quotes[channel].values
+    # Get the financial quotes, as contiguous float64 arrays
+    quotes = {channel: quotes[channel].to_numpy(dtype=np.float64)
               for channel in quote_channels}
     quotes['Dates'] = dates
 
     return quotes, macro
 
 
+def _cast_quotes(quotes: dict, dtype: type) -> dict:
+    """
+    Utility method for casting the quote channels of a quotes dictionary to a
+    given floating point type, without copying channels which are already of it.
+
+    :param quotes: (dict) The quotes, keyed by the quote channels and 'Dates'.
+    :param dtype: (type) The floating point type to cast the quotes to.
+
+    :return: (dict) The quotes, where all channels but 'Dates' are of type 'dtype'.
+    """
+
+    return {
+        channel: (values if channel == 'Dates'
+                  else np.asarray(values).astype(dtype, copy=False))
+        for channel, values in quotes.items()
+    }
+
+
 def get_asset_data(symbol: str, start_date: str, end_date: str = None,
                    quote_channels: (str, ...) = ('Adj Close', ...),
                    adjust_prices: bool = True,
-                   cache_path: str = None) -> (dict, [dict, ...]):
+                   cache_path: str = None,
+                   dtype: type = np.float64) -> (dict, [dict, ...]):
     """
     Wrapper method around _load_asset_data, which either uses cached data if available,
     otherwise calls _load_asset_data in order to query data.
@@ -305,6 +496,9 @@ def get_asset_data(symbol: str, start_date: str, end_date: str = None,
     defaults to True.
     :param cache_path: (str) Path to the directory in which to cache / look for cached
     data, if None does not use caching. Default is None.
+    :param dtype: (type) The floating point type of the returned quotes. Data is
+    cached as float64, so using np.float32 halves the memory of the quotes without
+    affecting the cache. Default is np.float64.
 
     :return: (Tuple) Tuple containing two dicts:
 
@@ -358,8 +552,10 @@ def get_asset_data(symbol: str, start_date: str, end_date: str = None,
                                               quote_channels=quote_channels,
                                               adjust_prices=adjust_prices)
 
+            os.makedirs(cache_path, exist_ok=True)
             with open(data_file, 'wb') as f:
-                pickle.dump(obj={'quotes': quotes, 'macros': macros}, file=f)
+                pickle.dump(obj={'quotes': quotes, 'macros': macros}, file=f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
 
     else:
         quotes, macros = _load_asset_data(symbol=symbol,
@@ -368,7 +564,7 @@ def get_asset_data(symbol: str, start_date: str, end_date: str = None,
                                           quote_channels=quote_channels,
                                           adjust_prices=adjust_prices)
 
-    return quotes, macros
+    return _cast_quotes(quotes=quotes, dtype=dtype), macros
 
 
 def _load_multiple_assets(
@@ -378,6 +574,7 @@ def _load_multiple_assets(
         quote_channels: (str, ...) = ('Adj Close', ...),
         adjust_prices: bool = True,
         cache_path: str = None,
+        verbose: bool = False,
 ) -> (dict, [dict, ...], list):
     """
     A utility method for loading  N multiple assets,
@@ -393,6 +590,10 @@ def _load_multiple_assets(
     'Close', 'Open', 'Low', 'High', 'Volume'.
     :param adjust_prices: (bool) Whether to adjust the Close/Open/High/Low quotes,
     defaults to True.
+    :param cache_path: (str) Path to the directory in which to cache / look for cached
+    data of each single asset, if None does not use caching. Default is None.
+    :param verbose: (bool) Whether to print the symbol of each asset as it is
+    being loaded. Defaults to False.
 
     :return: (Tuple) A tuple.
 
@@ -405,72 +606,46 @@ def _load_multiple_assets(
     macros of the respective asset in symbols_list/
     """
 
-    # Load all requested assets
+    def _load(symbol: str) -> (dict, dict):
+        if verbose:
+            print(f"Loading data for {symbol}")
+
+        try:
+            return get_asset_data(symbol=symbol,
+                                  start_date=start_date,
+                                  end_date=end_date,
+                                  quote_channels=quote_channels,
+                                  adjust_prices=adjust_prices,
+                                  cache_path=cache_path)
+
+        except Exception as e:
+            print(f"Could not load the data for {symbol}, "
+                  f"Exception is: {e}")
+            return None
+
+    # Load all requested assets concurrently, since the queries are I/O bound. Each
+    # asset is cached on its own by get_asset_data, and the results are collected
+    # in the order of 'symbols_list'.
+    with ThreadPoolExecutor(max_workers=min(32, max(1, len(symbols_list)))) as executor:
+        results = list(executor.map(_load, symbols_list))
+
+    # Symbols which could not be loaded are dropped, unless none of them was loaded
     quotes = []
     macros = []
-    if cache_path is not None:
-        cache_path = os.path.join(cache_path, 'single_assets')
-        os.makedirs(cache_path, exist_ok=True)
-
     loaded_symbols = []
-    for symbol in symbols_list:
-        print(f"Loading data for {symbol}")
-
-        # Generate cache signature
-        if cache_path is not None:
-            input_dict = {
-                'symbol': symbol,
-                'start_date': start_date,
-                'end_date': end_date,
-                'quote_channels': quote_channels,
-                'adjust_prices': adjust_prices,
-            }
-            hash_signature = dict_hash(input_dict)
-            data_file = os.path.join(cache_path, (hash_signature + '.pkl'))
-
-            # Check if the data was already cached
-            if os.path.isfile(data_file):
-                with open(data_file, 'rb') as f:
-                    cached_data = pickle.load(f)
-                    quote, macro = cached_data['quote'], cached_data['macro']
-
-                quotes.append(quote)
-                macros.append(macro)
-                loaded_symbols.append(symbol)
-
-            else:
-                try:
-                    quote, macro = _load_asset_data(symbol=symbol,
-                                                    start_date=start_date,
-                                                    end_date=end_date,
-                                                    quote_channels=quote_channels,
-                                                    adjust_prices=adjust_prices)
-
-                except Exception as e:
-                    print(f"Could not load the data for {symbol}, "
-                          f"Exception is: {e}")
-                    continue
-
-                with open(data_file, 'wb') as f:
-                    pickle.dump(obj={'quote': quote, 'macro': macro}, file=f)
-
-                quotes.append(quote)
-                macros.append(macro)
-                loaded_symbols.append(symbol)
-
-        else:
-            try:
-                quote, macro = _load_asset_data(symbol=symbol, start_date=start_date,
-                                                end_date=end_date,
-                                                quote_channels=quote_channels,
-                                                adjust_prices=adjust_prices)
-
-                quotes.append(quote)
-                macros.append(macro)
-                loaded_symbols.append(symbol)
-
-            except:
-                print(f"Could not load the data for {symbol}")
+    for symbol, result in zip(symbols_list, results):
+        if result is None:
+            continue
+
+        quotes.append(result[0])
+        macros.append(result[1])
+        loaded_symbols.append(symbol)
+
+    if not loaded_symbols:
+        raise ValueError(
+            f"Could not load the data for any of the requested symbols: "
+            f"{tuple(symbols_list)}."
+        )
 
     # Concatenate the quotes NumPy arrays
     dates = [len(q['Dates']) for q in quotes]
@@ -479,12 +654,18 @@ def _load_multiple_assets(
                     len(q['Dates']) >= valid_dates_len]
     dates = quotes[valid_assets[0]]['Dates'][-valid_dates_len:]
 
-    quotes = {
-        channel: np.concatenate(
-            [np.expand_dims(quotes[i][channel][-valid_dates_len:], 1) for i in
-             valid_assets], 1)
+    # Write the quotes of each asset directly into its column of a preallocated
+    # (T, N) array per channel. The arrays are column-major so that each asset's
+    # column is written, and later read, as a contiguous block.
+    stacked_quotes = {
+        channel: np.empty((valid_dates_len, len(valid_assets)), order='F')
         for channel in quote_channels if channel != 'Dates'
     }
+    for j, i in enumerate(valid_assets):
+        for channel in stacked_quotes:
+            stacked_quotes[channel][:, j] = quotes[i][channel][-valid_dates_len:]
+
+    quotes = stacked_quotes
     quotes['Dates'] = dates
     valid_symbols = [loaded_symbols[i] for i in valid_assets]
     macros = [macros[i] for i in valid_assets]
@@ -495,7 +676,9 @@ def _load_multiple_assets(
 def get_multiple_assets(symbols_list: (str, ...), start_date: str, end_date: str = None,
                         quote_channels: (str, ...) = ('Adj Close', ...),
                         adjust_prices: bool = True,
-                        cache_path: str = None) -> (dict, [dict, ...], list):
+                        cache_path: str = None,
+                        verbose: bool = False,
+                        dtype: type = np.float64) -> (dict, [dict, ...], list):
     """
     A method for querying N multiple assets and caching them if required.
     Wraps around the 'get_asset_data' method.
@@ -512,6 +695,11 @@ def get_multiple_assets(symbols_list: (str, ...), start_date: str, end_date: str
     defaults to True.
     :param cache_path: (str) Path to the directory in which to cache / look for cached
     data, if None does not use caching. Default is None.
+    :param verbose: (bool) Whether to print the symbol of each asset as it is
+    being loaded. Defaults to False.
+    :param dtype: (type) The floating point type of the returned quotes. Data is
+    cached as float64, so using np.float32 halves the memory of the quotes without
+    affecting the cache. Default is np.float64.
 
     :return: (Tuple) A tuple.
 
@@ -554,8 +742,10 @@ def get_multiple_assets(symbols_list: (str, ...), start_date: str, end_date: str
                 quote_channels=quote_channels,
                 adjust_prices=adjust_prices,
                 cache_path=cache_path,
+                verbose=verbose,
             )
 
+            os.makedirs(cache_path, exist_ok=True)
             with open(data_file, 'wb') as f:
                 pickle.dump(
                     obj={
@@ -564,6 +754,7 @@ def get_multiple_assets(symbols_list: (str, ...), start_date: str, end_date: str
                         "valid_symbols": valid_symbols,
                     },
                     file=f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
                 )
 
     else:
@@ -573,6 +764,7 @@ def get_multiple_assets(symbols_list: (str, ...), start_date: str, end_date: str
             end_date=end_date,
             quote_channels=quote_channels,
             adjust_prices=adjust_prices,
+            verbose=verbose,
         )
 
-    return quotes, macros, valid_symbols
+    return _cast_quotes(quotes=quotes, dtype=dtype), macros, valid_symbols
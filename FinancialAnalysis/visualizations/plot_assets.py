@@ -1,12 +1,36 @@
 from os import linesep
+from concurrent.futures import ThreadPoolExecutor
 from typing import Sequence, Dict, Tuple
-from datetime import datetime, timedelta
 from FinancialAnalysis.analysis.smoothing import Smoother
 from FinancialAnalysis.analysis.forecasting import Forecaster
 
+import copy
 import numpy as np
 import plotly.graph_objs as go
 
+# Largest magnitude up to which float32 represents every integer exactly
+FLOAT32_EXACT_INTEGER_LIMIT = 2 ** 24
+
+
+def _display_values(values: Sequence) -> np.ndarray:
+    """
+    A utility method for preparing the y-axis values of a trace for display. Float
+    values are handed to plotly as float32, which halves the size of the figure
+    serialized by plotly 6+, unless they exceed the range in which float32 is exact
+    for integers, e.g. trading volumes, in which case they are kept as is.
+
+    :param values: An iterable object containing the y-axis values of a trace.
+
+    :return: (np.ndarray) The values to display.
+    """
+
+    values = np.asarray(values)
+    if (np.issubdtype(values.dtype, np.floating) and
+            not np.any(np.abs(values) >= FLOAT32_EXACT_INTEGER_LIMIT)):
+        values = values.astype(np.float32)
+
+    return values
+
 
 def _plot_2d_lines(x_axes: Sequence[Sequence], y_axes: Sequence[Sequence],
                    plotting_params: Dict = None, figure: go.Figure = None,
@@ -34,41 +58,50 @@ def _plot_2d_lines(x_axes: Sequence[Sequence], y_axes: Sequence[Sequence],
             f" however len(x_axes) = {len(x_axes)} and len(y_axes) = {len(y_axes)}."
         )
 
-    if figure is None:
+    new_figure = figure is None
+    if new_figure:
         figure = go.Figure()
 
-    # Add the traces
-    [
-        figure.add_trace(
+    if plotting_params is None:
+        plotting_params = {}
+
+    # Resolve the parameters shared by all traces once
+    mode = plotting_params.get('mode', 'lines+markers')
+    legend = plotting_params.get('legend')
+    meta_data = plotting_params.get('meta_data')
+    line = None if line_color is None else dict(color=line_color)
+
+    # Add all traces in a single batch
+    figure.add_traces(
+        [
             go.Scatter(
                 x=x_axes[i],
-                y=y_axes[i],
-                mode=(
-                    plotting_params['mode']
-                    if 'mode' in plotting_params else 'lines+markers'
-                ),
-                name=(
-                    plotting_params['legend'][i]
-                    if 'legend' in plotting_params else f'trace {i}'
-                ),
-                text=(
-                    plotting_params['meta_data'][i]
-                    if 'meta_data' in plotting_params else ''
-                ),
-                line=None if line_color is None else dict(color=line_color)
+                y=_display_values(y_axes[i]),
+                mode=mode,
+                name=legend[i] if legend is not None else f'trace {i}',
+                text=meta_data[i] if meta_data is not None else '',
+                line=line,
             )
-        )
-        for i in range(len(x_axes))
-    ]
-
-    figure.update_layout(
-        title=(plotting_params['title'] if 'title' in plotting_params else ''),
-        xaxis={'title': plotting_params['xlabel']
-        if 'xlabel' in plotting_params else 'X Label'},
-        yaxis={'title': plotting_params['ylabel']
-        if 'ylabel' in plotting_params else 'Y Label'},
+            for i in range(len(x_axes))
+        ]
     )
 
+    # Lay out a new figure in full, but when adding lines to an existing figure only
+    # update the requested entries, so its title and labels are not reset and no
+    # redundant layout pass is triggered.
+    layout = {}
+    if new_figure or 'title' in plotting_params:
+        layout['title'] = plotting_params.get('title', '')
+
+    if new_figure or 'xlabel' in plotting_params:
+        layout['xaxis'] = {'title': plotting_params.get('xlabel', 'X Label')}
+
+    if new_figure or 'ylabel' in plotting_params:
+        layout['yaxis'] = {'title': plotting_params.get('ylabel', 'Y Label')}
+
+    if layout:
+        figure.update_layout(**layout)
+
     if show:
         figure.show()
 
@@ -97,7 +130,8 @@ def plot_assets_list(assets_symbols: Sequence, assets_data: Sequence, dates: Seq
 
     names = []
     infos = []
-    dates = [datetime.strptime(date, "%Y-%m-%d") for date in dates]
+    dates = np.asarray(dates, dtype='datetime64[D]')
+    display_keys = set(display_meta_paramets)
     x_axes = []
     y_axes = []
     for i, asset in enumerate(assets_data):
@@ -107,10 +141,9 @@ def plot_assets_list(assets_symbols: Sequence, assets_data: Sequence, dates: Seq
         names.append(f"{assets_symbols[i]}")
 
         if assets_meta_data is not None:
-            meta_info = assets_meta_data[i]
-            info = f'{linesep}'.join([f'{key}: {meta_info[key]}'
-                                      for key in meta_info
-                                      if key in display_meta_paramets])
+            info = linesep.join(f'{key}: {value}'
+                                for key, value in assets_meta_data[i].items()
+                                if key in display_keys)
             infos.append([info] * len(asset))
 
     xlabel = 'Date'
@@ -159,6 +192,7 @@ def plot_smooth_assets_list(
 
     # Plot the assets as is
     figure = figure if figure is not None else go.Figure()
+    dates = np.asarray(dates, dtype='datetime64[D]')
 
     plot_assets_list(
         assets_symbols=assets_symbols,
@@ -170,18 +204,53 @@ def plot_smooth_assets_list(
         show=False,
     )
 
-    names = []
-    x_axes = []
-    y_axes = []
-    for i, asset in enumerate(assets_data):
-        # Plot smoothed data
+    # When all assets share the same length, smoothers which support batches smooth
+    # all of the assets at once, over the columns of a single (T, N) array
+    batched_smoothed = {}
+    if len({len(asset) for asset in assets_data}) == 1:
+        stacked_assets = np.stack(assets_data, axis=1)
+        batched_smoothed = {
+            s: smoother(stacked_assets)
+            for s, smoother in enumerate(smoothers)
+            if smoother.batched
+        }
+
+    # Smooth all other (asset, smoother) pairs concurrently. A Smoother keeps the state
+    # of its last fit, hence each pair is smoothed by its own copy of the smoother.
+    def _smooth(pair: (int, int)) -> (np.ndarray, str):
+        smoother = copy.copy(smoothers[pair[1]])
+        smoothed_asset = smoother(assets_data[pair[0]])
+
+        return smoothed_asset, smoother.description
+
+    n_smoothers = len(smoothers)
+    pairs = [
+        (i, s)
+        for i in range(len(assets_data))
+        for s in range(n_smoothers)
+        if s not in batched_smoothed
+    ]
+    with ThreadPoolExecutor() as executor:
+        smoothed = dict(zip(pairs, executor.map(_smooth, pairs)))
+
+    # Line (i * n_smoothers + s) holds asset i smoothed by smoother s
+    n_lines = len(assets_data) * n_smoothers
+    names = [None] * n_lines
+    x_axes = [None] * n_lines
+    y_axes = [None] * n_lines
+    for i in range(len(assets_data)):
         for s, smoother in enumerate(smoothers):
-            smoothed_asset = smoother(asset)
-            x_axes.append(dates[-len(smoothed_asset):])
-            y_axes.append(smoothed_asset)
-            names.append(
-                f"{assets_symbols[i]} - {smoother.description}"
-            )
+            line = (i * n_smoothers) + s
+            if s in batched_smoothed:
+                smoothed_asset = batched_smoothed[s][:, i]
+                description = smoother.description
+
+            else:
+                smoothed_asset, description = smoothed[(i, s)]
+
+            x_axes[line] = dates[-len(smoothed_asset):]
+            y_axes[line] = smoothed_asset
+            names[line] = f"{assets_symbols[i]} - {description}"
 
     plotting_params = {
         'legend': names,
@@ -224,6 +293,7 @@ def plot_forecasts(
 
     # Plot raw + smoothed data if applicable
     figure = figure if figure is not None else go.Figure()
+    dates = np.asarray(dates, dtype='datetime64[D]')
 
     if smoother is not None:
         plot_smooth_assets_list(
@@ -245,40 +315,40 @@ def plot_forecasts(
         )
 
     # Add the dates for the final forecast period
-    dates = [datetime.strptime(date, "%Y-%m-%d") for date in dates]
-    new_dates = [(dates[-1] + timedelta(days=1))]
-    for f in range(forecaster.forecast_horizon - 1):
-        new_dates.append((new_dates[-1] + timedelta(days=1)))
+    new_dates = dates[-1] + np.arange(1, (forecaster.forecast_horizon + 1))
+    dates = np.concatenate([dates, new_dates])
 
-    dates.extend(new_dates)
-
-    # Compute forecasts
+    # Compute forecasts, all periods are gathered into a single line where
+    # consecutive periods are separated by a gap (None), so that plotly draws one
+    # trace instead of one trace per period.
     n_windows = len(time_series) - window_len
-    x_axes = []
-    y_axes = []
-    names = []
+    x_axis = []
+    y_axis = []
+    infos = []
     for i in range(n_windows):
         series_to_analyze = time_series[i:(i + window_len)]
         forecaster.reset()
         forecast = forecaster.forecast(series_to_analyze)
 
-        x_axes.append(
-            dates[(i + window_len - 1): (i + window_len + forecaster.forecast_horizon)]
-        )
-        y_axes.append(
-            np.concatenate(
-                [np.array([series_to_analyze[-1]]), forecast],
-                axis=0)
+        x_axis.extend(
+            dates[(i + window_len - 1): (i + window_len + len(forecast))]
         )
-        names.append(f"Forecast Period {i + 1}")
+        y_axis.append(series_to_analyze[-1])
+        y_axis.extend(forecast)
+        infos.extend([f"Forecast Period {i + 1}"] * (len(forecast) + 1))
+
+        x_axis.append(None)
+        y_axis.append(None)
+        infos.append('')
 
     # Plot all forecasts
     plotting_params = {
-        'legend': names,
+        'legend': ("Forecasts", ),
+        'meta_data': (infos, ),
     }
     _plot_2d_lines(
-        x_axes=x_axes,
-        y_axes=y_axes,
+        x_axes=(x_axis, ),
+        y_axes=(y_axis, ),
         plotting_params=plotting_params,
         figure=figure,
         line_color='black',
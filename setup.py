@@ -25,11 +25,11 @@ setup(
         exclude=['data']
     ),
     install_requires=[
-        'beautifulsoup4',
+        'lxml',
         'numpy==1.19.3',
         'yfinance',
         'scipy',
-        'statsmodels',
+        'statsmodels>=0.12',
         'matplotlib',
         'seaborn',
         'Jupyter',
@@ -38,13 +38,14 @@ setup(
         'jupyterlab',
         'requests',
         'pytest',
+        'pytest-xdist',
         'html5lib',
-        'plotly',
+        'plotly>=4.0',
     ],
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: GNU General Public License v3.0",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.7',
+    python_requires='>=3.8',
 )
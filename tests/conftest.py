@@ -1,13 +1,27 @@
-from src import PROJECT_ROOT
 from src.analysis.scanning import Scanner
 from src.analysis.analyzing import Analyzer
+from src.analysis.smoothing import Smoother
 
 import os
 import shutil
 import pytest
 import numpy as np
 
-np.random.seed(42)
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """
+    Marks an array generated by the session-scoped data fixtures as read-only, so
+    that a test modifying its inputs in-place fails, instead of silently changing
+    the data of the tests following it.
+
+    :param array: (NumPy array) The array to mark
+
+    :return: (NumPy array) The marked array
+    """
+
+    array.setflags(write=False)
+
+    return array
 
 
 @pytest.fixture
@@ -29,14 +43,13 @@ def get_quote_params():
 
 
 @pytest.fixture
-def get_multple_quotes_params():
+def get_multple_quotes_params(tmp_path_factory):
     symbols_list = ('MSFT', 'GOOGL', 'AAPL')
     start_date = "2010-01-01"
     end_date = "2011-01-01"
     quote_channels = ('Close', 'Open', 'High', 'Low', 'Volume')
     adjust_prices = True
-    cache_path = os.path.join(PROJECT_ROOT, 'data', 'tmp_test')
-    os.makedirs(cache_path, exist_ok=True)
+    cache_path = str(tmp_path_factory.mktemp('tmp_test'))
 
     params = {
         'symbols_list': symbols_list,
@@ -50,7 +63,7 @@ def get_multple_quotes_params():
     return params
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_exp_smooth_params():
     method = 'exp'
     alpha = 0.6
@@ -65,7 +78,7 @@ def get_exp_smooth_params():
     return params
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_holt_winters_smoothing_params():
     method = 'holt_winter'
     trend = 'additive'
@@ -78,7 +91,20 @@ def get_holt_winters_smoothing_params():
     return params
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def get_holt_winters_mul_smoothing_params():
+    method = 'holt_winter'
+    trend = 'multiplicative'
+
+    params = {
+        'method': method,
+        'trend': trend,
+    }
+
+    return params
+
+
+@pytest.fixture(scope="session")
 def get_running_window_smoothing_params():
     method = 'avg'
     length = 10
@@ -91,7 +117,7 @@ def get_running_window_smoothing_params():
     return params
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_fit_polyfit_params():
     method = 'polyfit'
     poly_degree = 3
@@ -104,8 +130,36 @@ def get_fit_polyfit_params():
     return params
 
 
+@pytest.fixture(scope="session")
+def get_test_cache_path(tmp_path_factory):
+    cache_path = str(tmp_path_factory.mktemp('test_cache'))
+
+    return cache_path
+
+
 @pytest.fixture
-def get_analyzer():
+def clear_test_cache_dir():
+    def _clear_test_cache_dir(cache_path: str) -> None:
+        """
+        Clears all files cached in a cache dir, while keeping the dir itself.
+
+        :param cache_path: (str) The cache dir to clear
+
+        :return: None
+        """
+
+        for entry in os.scandir(cache_path):
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+
+            else:
+                os.unlink(entry.path)
+
+    return _clear_test_cache_dir
+
+
+@pytest.fixture(scope="class")
+def get_analyzer(get_test_cache_path):
     symbols_list = ("MSFT", "AAPL", "JPM", "C", "DIS")
     start_date = "2015-01-01"
     end_date = "2016-01-01"
@@ -115,8 +169,7 @@ def get_analyzer():
     bins = 10
     spectral_energy_threshold = 0.05
     trend_period_length = 10
-    cache_path = os.path.join(PROJECT_ROOT, 'tests', 'test_cache')
-    os.makedirs(cache_path, exist_ok=True)
+    cache_path = get_test_cache_path
 
     analyzer = Analyzer(symbols_list=symbols_list, start_date=start_date,
                         end_date=end_date, quote_channel=quote_channel,
@@ -130,15 +183,14 @@ def get_analyzer():
 
 
 @pytest.fixture
-def get_scanner(get_analyzer):
+def get_scanner(get_analyzer, get_test_cache_path):
     symbols_list = ("MSFT", "AAPL", "JPM", "C", "DIS")
     start_date = "2015-01-01"
     end_date = "2016-01-01"
     quote_channel = 'Close'
     adjust_prices = True
     smoother = None
-    cache_path = os.path.join(PROJECT_ROOT, 'tests', 'test_cache')
-    os.makedirs(cache_path, exist_ok=True)
+    cache_path = get_test_cache_path
 
     scanner = Scanner(symbols_list=symbols_list, start_date=start_date,
                       end_date=end_date, quote_channel=quote_channel,
@@ -150,80 +202,168 @@ def get_scanner(get_analyzer):
     return scanner
 
 
-class BasicTestingData:
-    def get_linear(self):
-        self.x = np.linspace(start=-1.0, stop=1.0, num=150000)
-        self.y = self.x + np.random.normal(loc=0, scale=0.1, size=(len(self.x, )))
-
-    def get_poly_deg2(self):
-        x = np.linspace(start=-1, stop=1, num=10000)
-        self.x = (-2 * x) + np.power(x, 2)
-        self.y = self.x + np.random.normal(loc=0, scale=0.1, size=(len(self.x, )))
-
-    def get_forecasting_data(self):
-        noise_scale = 0.1
-        window_length = 100000
-        trend = np.linspace(start=-2, stop=2, num=window_length)
-        scale = np.random.uniform(low=-0.5, high=0.5, size=(1,))
-        offset = np.random.uniform(low=-2, high=2, size=(1,))
-        noise = np.random.normal(loc=0, scale=noise_scale, size=(window_length,))
-
-        self.x = offset + scale * trend
-        self.y = self.x + noise
-
-    def get_forecasting_data_poly_deg2(self):
-        noise_scale = 0.1
-        window_length = 100000
-        trend = np.linspace(start=-2, stop=2, num=window_length)
-        trend = (1.5 * trend) + (-2 * np.power(trend, 2))
-        offset = np.random.uniform(low=-2, high=2, size=(1,))
-        noise = np.random.normal(loc=0, scale=noise_scale, size=(window_length,))
-
-        self.x = offset + trend
-        self.y = self.x + noise
-
-    def get_forecasting_data_arima(self):
-        noise_scale = 0.01
-        window_length = 100
-        trend = np.linspace(start=-2, stop=2, num=window_length)
-        scale = np.random.uniform(low=-0.5, high=0.5, size=(1,))
-        offset = np.random.uniform(low=-2, high=2, size=(1,))
-        noise = np.random.normal(loc=0, scale=noise_scale, size=(window_length,))
-
-        self.x = offset + scale * trend
-        self.y = self.x + noise
-
-
-# Clear the tests cache dir when tearing down the tests session
-def pytest_sessionfinish(session, exitstatus):
+@pytest.fixture(scope="session")
+def get_wiki_constituents_page():
+    # Trimmed down copy of a Wikipedia index page, where the constituents table
+    # follows another sortable table, and has linked and padded cells
+    page = b"""
+    <html><body>
+    <table class="wikitable sortable">
+        <tr><th>Date</th><th>Added</th></tr>
+        <tr><td>2021-01-01</td><td>TSLA</td></tr>
+    </table>
+    <table class="wikitable sortable sticky-header" id="constituents">
+        <tbody>
+        <tr><th>Symbol</th><th>Security</th><th>GICS Sector</th></tr>
+        <tr>
+            <td><a href="/wiki/3M">MMM</a>\n</td>
+            <td><a href="/wiki/3M">3M</a></td>
+            <td>Industrials</td>
+        </tr>
+        <tr><td>AOS</td><td> A. O. Smith </td><td>Industrials</td></tr>
+        <tr><td>BRK.B</td><td>Berkshire Hathaway</td><td>Financials</td></tr>
+        </tbody>
+    </table>
+    </body></html>
     """
-    Called after whole test run finished, right before
-    returning the exit status to the system.
 
-    :param session: (pytest.Session) – The pytest session object.
-    :param exitstatus: (int) – The status which pytest will return to the system.
+    return page
+
+
+@pytest.fixture(scope="session")
+def get_linear():
+    rng = np.random.default_rng(42)
+    x = np.linspace(start=-1.0, stop=1.0, num=5000)
+    y = x + (rng.standard_normal(len(x)) * 0.1)
+
+    return _read_only(x), _read_only(y)
 
-    :return: None
-    """
 
-    # Get the tests cache dir location
-    cache_dir_path = os.path.join(PROJECT_ROOT, 'tests', 'test_cache')
+@pytest.fixture(scope="session")
+def get_poly_deg2():
+    rng = np.random.default_rng(42)
+    x = np.linspace(start=-1, stop=1, num=10000)
+    x = (-2 * x) + (x * x)
+    y = x + (rng.standard_normal(len(x)) * 0.1)
 
-    # Get all files in the cache dir
-    files = [os.path.join(cache_dir_path, f) for f in os.listdir(cache_dir_path)]
+    return _read_only(x), _read_only(y)
 
-    # Clear all files
-    for file_path in files:
-        try:
-            if os.path.isfile(file_path) or os.path.islink(file_path):
-                os.unlink(file_path)
 
-            elif os.path.isdir(file_path):
-                shutil.rmtree(file_path)
+@pytest.fixture(scope="session")
+def get_forecasting_trend():
+    window_length = 20000
+    trend = np.linspace(start=-2, stop=2, num=window_length)
 
-        except OSError as e:
-            print(f'Failed to delete {file_path} due to OSError: {e}')
+    return _read_only(trend)
+
+
+@pytest.fixture(scope="session")
+def get_forecasting_data(get_forecasting_trend):
+    rng = np.random.default_rng(42)
+    noise_scale = 0.1
+    trend = get_forecasting_trend
+    window_length = len(trend)
+    scale = rng.uniform(low=-0.5, high=0.5, size=(1,))
+    offset = rng.uniform(low=-2, high=2, size=(1,))
+    noise = rng.standard_normal(window_length) * noise_scale
+
+    x = offset + scale * trend
+    y = x + noise
+
+    return _read_only(x), _read_only(y)
+
+
+@pytest.fixture(scope="session")
+def get_positive_forecasting_data(get_forecasting_data):
+    # Shifted to be strictly positive, as required by a multiplicative trend
+    x, y = get_forecasting_data
+    shift = 1 - np.min(y)
+
+    return _read_only(x + shift), _read_only(y + shift)
+
+
+@pytest.fixture(scope="session")
+def get_forecasting_data_poly_deg2(get_forecasting_trend):
+    rng = np.random.default_rng(42)
+    noise_scale = 0.1
+    trend = get_forecasting_trend
+    window_length = len(trend)
+    trend = (1.5 * trend) + (-2 * (trend * trend))
+    offset = rng.uniform(low=-2, high=2, size=(1,))
+    noise = rng.standard_normal(window_length) * noise_scale
+
+    x = offset + trend
+    y = x + noise
+
+    return _read_only(x), _read_only(y)
+
+
+@pytest.fixture(scope="session")
+def get_forecasting_data_arima():
+    rng = np.random.default_rng(42)
+    noise_scale = 0.01
+    window_length = 100
+    trend = np.linspace(start=-2, stop=2, num=window_length)
+    scale = rng.uniform(low=-0.5, high=0.5, size=(1,))
+    offset = rng.uniform(low=-2, high=2, size=(1,))
+    noise = rng.standard_normal(window_length) * noise_scale
+
+    x = offset + scale * trend
+    y = x + noise
+
+    return _read_only(x), _read_only(y)
+
+
+# Maps a fitting case to the (Smoother params fixture, data fixture, held-out horizon)
+# used for building it, the Smoother is fitted on all but the last 'horizon' samples
+SMOOTHER_FIT_CASES = {
+    'exp': ('get_exp_smooth_params', 'get_linear', 0),
+    'holt_winter': ('get_holt_winters_smoothing_params', 'get_poly_deg2', 0),
+    'holt_winter_mul': ('get_holt_winters_mul_smoothing_params',
+                        'get_positive_forecasting_data', 0),
+    'avg': ('get_running_window_smoothing_params', 'get_linear', 0),
+    'exp_forecast': ('get_exp_forecast_params', 'get_forecasting_data', 5),
+    'holt_winter_forecast': ('get_holt_winters_forecast_params',
+                             'get_forecasting_data', 5),
+}
+
+
+@pytest.fixture(scope="session")
+def get_exp_forecast_params():
+    params = {
+        'method': 'exp',
+        'optimize': True,
+    }
+
+    return params
+
+
+@pytest.fixture(scope="session")
+def get_holt_winters_forecast_params():
+    params = {
+        'method': 'holt_winter',
+        'trend': None,
+    }
+
+    return params
+
+
+@pytest.fixture(scope="module")
+def smoother_and_fit(request):
+    """
+    Builds and fits a Smoother once per module for each of the cases in
+    SMOOTHER_FIT_CASES, tests select their case by indirect parametrization, i.e.
+    @pytest.mark.parametrize('smoother_and_fit', ['exp'], indirect=True)
+
+    :param request: (pytest.FixtureRequest) The fixture request, 'param' holds the
+    key of the requested case.
+
+    :return: (tuple) The fitted Smoother, the smoothed series and the (x, y) data
+    """
 
-        except Exception as e:
-            print(f'Failed to delete {file_path} due to Error: {e}')
+    params_fixture, data_fixture, horizon = SMOOTHER_FIT_CASES[request.param]
+    x, y = request.getfixturevalue(data_fixture)
+    smoother = Smoother(**request.getfixturevalue(params_fixture))
+    smoothed = smoother(y[:len(y) - horizon])
 
+    return smoother, smoothed, x, y
@@ -3,9 +3,6 @@ import numpy as np
 
 
 class TestAnalyzer:
-    def _clear_test_cache(self, get_analyzer, clear_test_cache_dir):
-        clear_test_cache_dir(get_analyzer.cache_path)
-
     def test_compute_returns(self, get_analyzer):
         returns = get_analyzer.returns
 
@@ -22,7 +19,7 @@ class TestAnalyzer:
         assert diff == pytest.approx(0, abs=1e-6)
 
     def test_analyze_sr(self, get_analyzer):
-        sr = get_analyzer._analyze_sr()
+        sr = get_analyzer.sr
 
         assert np.max(np.abs(sr)) <= 4
 
@@ -42,7 +39,7 @@ class TestAnalyzer:
         assert np.max(np.abs(values)) < 0.25
 
     def test_compute_mean_annual_return(self, get_analyzer):
-        mean_annual_returns = get_analyzer._compute_mean_annual_return()
+        mean_annual_returns = get_analyzer.mean_annual_return
 
         assert len(get_analyzer.symbols_list) == len(mean_annual_returns)
         assert np.max(np.abs(mean_annual_returns)) < 0.25
@@ -73,7 +70,7 @@ class TestAnalyzer:
         assert np.max(np.abs(trend_std)) <= 0.1
 
     def test_compute_overall_period_return(self, get_analyzer):
-        overall_returns = get_analyzer._compute_overall_period_return()
+        overall_returns = get_analyzer.overall_period_return
 
         assert len(overall_returns) == len(get_analyzer.symbols_list)
         assert np.max(np.abs(overall_returns)) <= 0.1
@@ -2,13 +2,15 @@ from datetime import datetime
 from src.utils.hashing import dict_hash
 from src.stocks_io.data_queries import (
     get_sp500_symbols_wiki,
+    get_indices_symbols_wiki,
     get_nasdaq_listed_symbols,
+    _parse_wiki_table,
     _load_asset_data,
     get_multiple_assets,
 )
 
 import os
-import shutil
+import pytest
 import numpy as np
 
 
@@ -41,6 +43,34 @@ class TestDataQueries:
             assert os.sep not in names[i]
             assert names[i][-1] != ' '
 
+    def test_parse_wiki_table(self, get_wiki_constituents_page):
+        symbols, names = _parse_wiki_table(content=get_wiki_constituents_page,
+                                           table_id='constituents',
+                                           symbol_column=0, name_column=1)
+
+        assert symbols == ('MMM', 'AOS', 'BRK.B')
+        assert names == ('3M', 'A. O. Smith', 'Berkshire Hathaway')
+
+        with pytest.raises(AssertionError):
+            _parse_wiki_table(content=get_wiki_constituents_page,
+                              table_id='missing_table', symbol_column=0,
+                              name_column=1)
+
+    def test_get_indices_symbols_wiki(self):
+        symbols, names = get_indices_symbols_wiki(indices=('sp500', 'nasdaq100'))
+        sp500_symbols, _ = get_sp500_symbols_wiki()
+
+        assert isinstance(symbols, list)
+        assert isinstance(names, list)
+        assert len(symbols) == len(names)
+        assert len(set(symbols)) == len(symbols)  # No repeated symbols
+        assert symbols[:len(sp500_symbols)] == sp500_symbols
+        for i, sym in enumerate(symbols):
+            assert isinstance(sym, str)
+            assert isinstance(names[i], str)
+
+        assert get_indices_symbols_wiki(indices=()) == ([], [])
+
     def test_get_quotes(self, get_quote_params):
         quotes, macros = _load_asset_data(**get_quote_params)
 
@@ -77,9 +107,8 @@ class TestDataQueries:
             assert key in macros
             assert isinstance(macros[key], datetime)
 
-    def test_get_multiple_assets(self, get_multple_quotes_params):
-        np.random.seed(42)
-        quotes, macros = get_multiple_assets(**get_multple_quotes_params)
+    def test_get_multiple_assets(self, get_multple_quotes_params, clear_test_cache_dir):
+        quotes, macros, _ = get_multiple_assets(**get_multple_quotes_params)
 
         assert len(macros) == len(get_multple_quotes_params['symbols_list'])
         assert len(quotes) == len(get_multple_quotes_params['quote_channels']) + 1
@@ -99,7 +128,7 @@ class TestDataQueries:
         assert os.path.isfile(data_file)
 
         # Cached data must be identical to the loaded data
-        quotes_2, macros_2 = get_multiple_assets(**get_multple_quotes_params)
+        quotes_2, macros_2, _ = get_multiple_assets(**get_multple_quotes_params)
         assert len(quotes) == len(quotes_2)
         assert len(macros) == len(macros_2)
 
@@ -114,5 +143,12 @@ class TestDataQueries:
                 else:
                     assert macros_2[i][key] is None
 
-        shutil.rmtree(get_multple_quotes_params['cache_path'])
+        # Loading into an emptied cache dir must query and cache the data again
+        clear_test_cache_dir(get_multple_quotes_params['cache_path'])
+        assert not os.listdir(get_multple_quotes_params['cache_path'])
+
+        quotes_3, _, _ = get_multiple_assets(**get_multple_quotes_params)
+        assert os.path.isfile(data_file)
+        for quote in get_multple_quotes_params['quote_channels']:
+            assert np.sum(np.abs(quotes[quote] - quotes_3[quote])) == 0
 
@@ -1,8 +1,12 @@
+from types import SimpleNamespace
+from src.analysis.scanning import Scanner
+
 import pytest
+import numpy as np
 
 
 class TestScanner:
-    def test_set_criterions(self, get_scanner, clear_test_cache_dir):
+    def test_set_criterions(self, get_scanner):
         macro_criterion = {
             'some_false_criterion': (0, 1)
         }
@@ -16,3 +20,37 @@ class TestScanner:
 
         with pytest.raises(AssertionError):
             get_scanner.set_quote_criterions(quote_criterion)
+
+    def test_quote_criterions(self):
+        # The criterions are tested over the analysis results of all assets at once,
+        # so only the symbols and the criterions are needed from the Scanner
+        scanner = SimpleNamespace(symbols_list=['A', 'B', 'C', 'D'],
+                                  quote_criterions={})
+        quotes_analysis = {
+            'sr': np.array([1.0, 2.0, np.nan, 1.5]),
+            'mean': np.array([0.1, 0.2, 0.1, 0.5]),
+            'linear_regression_fit': np.array([
+                [1.0, 0.0, 0.9],
+                [-1.0, 0.0, 0.9],
+                [1.0, 0.0, 0.9],
+                [1.0, 0.0, 0.2],
+            ]),
+        }
+
+        # A NaN statistic fails its range
+        scanner.quote_criterions = {'sr': (0, 3)}
+        mask = Scanner._test_quote_criterions(scanner, quotes_analysis)
+        assert mask.tolist() == [True, True, False, True]
+
+        # None bounds of the linear regression fit are not tested
+        scanner.quote_criterions = {'linear_regression_fit': (None, None, 0.5)}
+        mask = Scanner._test_quote_criterions(scanner, quotes_analysis)
+        assert mask.tolist() == [True, True, True, False]
+
+        # All criterions must hold, including those following the linear fit
+        scanner.quote_criterions = {
+            'linear_regression_fit': (0, None, None),
+            'mean': (0, 0.3),
+        }
+        mask = Scanner._test_quote_criterions(scanner, quotes_analysis)
+        assert mask.tolist() == [True, False, True, False]
@@ -1,58 +1,62 @@
 from src.analysis.smoothing import Smoother
-from tests.conftest import BasicTestingData
 
 import numpy as np
 import pytest
 
 
-testing_data = BasicTestingData()
-
-
 class TestSmoother:
-    def test_exponential_smoothing(self, get_exp_smooth_params):
-        testing_data.get_linear()
-        x, y = testing_data.x, testing_data.y
-        smoother = Smoother(**get_exp_smooth_params)
-        smoothed = smoother(y)
-
-        # Test shapes
-        assert smoothed.shape == x.shape
-
-        # The average error should be smaller then the scale of the i.i.d noise
-        diff = np.abs(x - smoothed)
-        assert np.mean(diff) == pytest.approx(0, abs=1e-2)
-
-    def test_holt_winters_smoothing(self, get_holt_winters_smoothing_params):
-        testing_data.get_poly_deg2()
-        x, y = testing_data.x, testing_data.y
-        smoother = Smoother(**get_holt_winters_smoothing_params)
-        smoothed = smoother(y)
+    @pytest.mark.parametrize('smoother_and_fit, margin, tol', [
+        ('exp', 0, 2e-2),
+        ('holt_winter', 0, 1e-2),
+        ('holt_winter_mul', 0, 1e-2),
+        ('avg', 10, 3e-2),
+    ], indirect=['smoother_and_fit'])
+    def test_smoothing(self, smoother_and_fit, margin, tol):
+        _, smoothed, x, _ = smoother_and_fit
 
         # Test shapes
         assert smoothed.shape == x.shape
 
-        # The average error should be smaller then the scale of the i.i.d noise
-        diff = np.abs(x - smoothed)
-        assert np.mean(diff) == pytest.approx(0, abs=1e-2)
+        # The average error should be on the same scale as the i.i.d noise, for the
+        # running window only over the valid part of the convolution
+        diff = np.abs(x[margin:(len(x) - margin)] -
+                      smoothed[margin:(len(smoothed) - margin)])
+        assert np.mean(diff) == pytest.approx(0, abs=tol)
 
-    def test_running_window_smoothing(self, get_running_window_smoothing_params):
-        testing_data.get_linear()
-        x, y = testing_data.x, testing_data.y
+    def test_running_window_smoothing_batch(self, get_running_window_smoothing_params,
+                                            get_linear):
+        _, y = get_linear
+        batch = np.stack([y, 2 * y, -y], axis=1)
         smoother = Smoother(**get_running_window_smoothing_params)
-        smoothed = smoother(y)
+        smoothed = smoother(batch)
+
+        # Smoothing a batch must be identical to smoothing each time-series on its own
+        assert smoother.batched
+        for i in range(batch.shape[1]):
+            assert np.allclose(smoothed[:, i], smoother(batch[:, i]))
+
+    @pytest.mark.parametrize('length', [10, 20])
+    def test_running_window_smoothing_nan(self, get_linear, length):
+        _, y = get_linear
+        nan_index = 100
+        time_series = y.copy()
+        time_series[nan_index] = np.nan
+        batch = np.stack([time_series, y], axis=1)
+        smoother = Smoother(method='avg', length=length)
+        smoothed = smoother(time_series)
 
-        # Test shapes
-        assert smoothed.shape == x.shape
+        # A missing observation only affects the windows containing it
+        windows_nan = np.zeros(len(y), dtype=bool)
+        windows_nan[nan_index:(nan_index + length)] = True
+        assert np.array_equal(np.isnan(smoothed), windows_nan)
+        assert np.allclose(smoothed[~windows_nan], smoother(y)[~windows_nan])
 
-        # The average error should be on the same scale as the i.i.d noise on the
-        # valid part of the convolution
-        diff = np.abs(x[smoother.length:-smoother.length] -
-                      smoothed[smoother.length:-smoother.length])
-        assert np.mean(diff) == pytest.approx(0, abs=3e-2)
+        # Smoothing a batch must handle it identically
+        assert np.allclose(smoother(batch)[:, 0], smoothed, equal_nan=True)
 
     def test_fit_polyfit(self, get_fit_polyfit_params):
-        time_series = np.arange(1000)
-        time_series = (-2 * time_series) * np.power(time_series, 2)
+        t = np.arange(1000, dtype=np.float64) / 1000.0
+        time_series = -2.0 * t * t * t
         smoother = Smoother(**get_fit_polyfit_params)
         smoothed = smoother(time_series)
 